@@ -37,6 +37,8 @@ setuptools.setup(
     entry_points={
         "console_scripts": [
             "game = game.main:run",
+            "game-reachability = game.reachability:main",
+            "game-memory = game.memory:main",
         ],
     },
 )
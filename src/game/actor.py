@@ -1,7 +1,7 @@
 """Module for the Actor base class."""
 import logging
 
-from typing import Any
+from typing import Any, Iterable
 from pathlib import Path
 from itertools import cycle
 
@@ -29,6 +29,14 @@ class Actor:
         Reference to the current level.
     """
 
+    # Define speeds
+    speed = 8
+    jump_speed = 16
+    gravity = 0.8
+
+    # Scaled animation frames, shared between actors
+    _frame_sets = {}
+
     def __init__(
         self,
         x: int,
@@ -47,11 +55,6 @@ class Actor:
         self.rect = pygame.Rect(x, y, width, height)
         self.direction = pygame.Vector2(0, 0)
 
-        # Define speeds
-        self.speed = 8
-        self.jump_speed = 16
-        self.gravity = 0.8
-
         self.last_animation = None
         self.last_tick = -1
         self.animations = self.load_animations(animation_path)
@@ -62,6 +65,9 @@ class Actor:
     def load_animations(self, base_path: Path) -> dict:
         """Loads player animations.
 
+        Scaled frames are shared between all actors using the same
+        animations folder and size, only the cycles are per actor.
+
         Parameters
         ----------
         base_path : Path
@@ -72,23 +78,65 @@ class Actor:
         dict
             Dict mapping animations to cycles of images.
         """
+        key = (str(base_path), self.width, self.height)
+        if key not in self._frame_sets:
+            self._frame_sets[key] = self.load_frames(base_path)
+        self.frames = self._frame_sets[key]
+
+        return {animation: cycle(frames) for animation, frames in self.frames.items()}
+
+    def load_frames(self, base_path: Path) -> dict:
+        """Loads and scales the animation frames.
+
+        Parameters
+        ----------
+        base_path : Path
+            Path to the actors animations folder.
+
+        Returns
+        -------
+        dict
+            Dict mapping animations to lists of images.
+        """
 
-        animations = {}
+        frames = {}
         for animation in "fall", "idle", "jump", "run":
             anim_path = base_path / animation
             images = anim_path.glob("*.png")
 
-            images = cycle(
-                [
-                    pygame.transform.scale(
-                        self.load_image(i).convert_alpha(), (self.width, self.height)
-                    )
-                    for i in images
-                ]
-            )
-            animations[animation] = images
+            frames[animation] = [
+                pygame.transform.scale(
+                    self.load_image(i).convert_alpha(), (self.width, self.height)
+                )
+                for i in images
+            ]
+
+        return frames
 
-        return animations
+    @classmethod
+    def cached_frames(cls) -> list:
+        """Returns the shared animation frame sets.
+
+        Returns
+        -------
+        list of dict
+            Dicts mapping animations to lists of images.
+        """
+        return list(cls._frame_sets.values())
+
+    @classmethod
+    def clear_frame_cache(cls, keep: Iterable = ()) -> None:
+        """Drops shared animation frames, except the frame sets in use.
+
+        Parameters
+        ----------
+        keep : iterable of dict
+            Frame sets still in use, these stay shared.
+        """
+        keep = {id(frames) for frames in keep}
+        for key, frames in list(cls._frame_sets.items()):
+            if id(frames) not in keep:
+                del cls._frame_sets[key]
 
     def move(self, direction: str) -> None:
         """Move the actor in the provided direction.
@@ -204,7 +252,8 @@ class Actor:
 
         tick = pygame.time.get_ticks()
         if animation in self.animations:
-            if self.last_animation != animation or tick - self.last_tick > 100:
+            interval = self.level.animation_interval
+            if self.last_animation != animation or tick - self.last_tick > interval:
                 self.image = next(self.animations[animation])
                 if flip_horizontal:
                     self.image = pygame.transform.flip(self.image, True, False)
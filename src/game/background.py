@@ -0,0 +1,136 @@
+"""Module for parallax background classes."""
+import math
+import logging
+
+import pygame
+
+from game.assets import AssetMixin
+
+
+class ParallaxLayer(AssetMixin):
+    """Single background image scrolling at a fraction of the camera speed.
+
+    The image is scaled and tiled into a horizontal strip once, which is
+    at least as wide as the window. Drawing the layer then takes at most
+    two blits, regardless of the level width.
+
+    Parameters
+    ----------
+    image_path : str
+        Path to the background image.
+    scroll : float
+        Scroll factor relative to the camera, 0 is static, 1 moves with the tiles.
+        Applies both horizontally and vertically.
+    window_size : pygame.Vector2
+        Size of the game window.
+    y : int
+        Vertical screen position of the layer with the camera at the top.
+    height : int, optional
+        Height to scale the image to, defaults to the window height.
+    """
+
+    _strips = {}
+
+    def __init__(self, image_path, scroll, window_size, y=0, height=None):
+        self._log = logging.getLogger(__name__)
+
+        self.scroll = float(scroll)
+        self.y = int(y)
+        self.window_width = int(window_size.x)
+        height = int(height or window_size.y)
+
+        key = (str(image_path), self.window_width, height)
+        if key not in self._strips:
+            self._strips[key] = self.build_strip(image_path, height)
+        self.strip = self._strips[key]
+
+    @classmethod
+    def cached_strips(cls):
+        """Returns the shared strips."""
+        return list(cls._strips.values())
+
+    @classmethod
+    def clear_cache(cls, keep=()):
+        """Drops the shared strips, except the strips in use.
+
+        Parameters
+        ----------
+        keep : iterable of pygame.Surface
+            Strips still in use, these stay shared.
+        """
+        keep = {id(strip) for strip in keep}
+        for key, strip in list(cls._strips.items()):
+            if id(strip) not in keep:
+                del cls._strips[key]
+
+    def build_strip(self, image_path, height):
+        """Scales the image and tiles it into a strip covering the window."""
+        self._log.debug(f"Building parallax strip for {image_path!r}.")
+
+        # Opaque layers, such as the sky, skip alpha blending every frame
+        image = self.load_image(image_path)
+        transparent = bool(image.get_flags() & pygame.SRCALPHA)
+        transparent = transparent or image.get_colorkey() is not None
+        image = image.convert_alpha() if transparent else image.convert()
+
+        if image.get_height() != height:
+            width = max(1, round(image.get_width() * height / image.get_height()))
+            image = pygame.transform.smoothscale(image, (width, height))
+
+        tile_width = image.get_width()
+        count = max(1, math.ceil(self.window_width / tile_width))
+        size = (count * tile_width, height)
+        if transparent:
+            strip = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        else:
+            strip = pygame.Surface(size).convert()
+        for i in range(count):
+            strip.blit(image, (i * tile_width, 0))
+
+        return strip
+
+    def commands(self, camera):
+        """Returns the draw commands for the current camera state."""
+        width, height = self.strip.get_size()
+        start = int(-camera.state.x * self.scroll) % width
+        y = self.y + int(camera.state.y * self.scroll)
+
+        # Draw from the scroll position to the end of the strip...
+        first = width - start
+        commands = [(self.strip, (0, y), pygame.Rect(start, 0, first, height))]
+
+        # ...and wrap around to fill the remainder of the window
+        if first < self.window_width:
+            commands.append(
+                (
+                    self.strip,
+                    (first, y),
+                    pygame.Rect(0, 0, self.window_width - first, height),
+                )
+            )
+
+        return commands
+
+
+class ParallaxBackground:
+    """Stack of parallax layers, drawn back to front.
+
+    Parameters
+    ----------
+    layers : list of ParallaxLayer
+        Layers to draw, the first layer is drawn at the back.
+    """
+
+    def __init__(self, layers):
+        self.layers = layers
+        self.enabled = True
+
+    def commands(self, camera):
+        """Returns the draw commands for all layers."""
+        if not self.enabled:
+            return []
+
+        commands = []
+        for layer in self.layers:
+            commands.extend(layer.commands(camera))
+        return commands
@@ -0,0 +1,157 @@
+"""Module for the TileCompositor class."""
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+
+import pygame
+
+from game.assets import AssetMixin
+
+
+DEFAULT_CACHE_PATH = ".cache/tiles"
+
+
+class TileCompositor(AssetMixin):
+    """Builds composited tile variants once and caches them on disk.
+
+    Baked variants are stored as PNG files named after a hash of the
+    source image contents and the overlay offset, so changing either
+    image automatically invalidates the cached variant. Source hashes are
+    kept in an index by file size and modification time, so a cache hit
+    neither reads nor decodes the source images.
+
+    Parameters
+    ----------
+    cache_path : str or pathlib.Path
+        Folder to store the baked tile variants in.
+    """
+
+    def __init__(self, cache_path=DEFAULT_CACHE_PATH):
+        self._log = logging.getLogger(__name__)
+        self.cache_path = Path(cache_path)
+
+        self._index_file = self.cache_path / "hashes.json"
+        self._hashes = self._load_index()
+        self._variants = {}
+
+    def composite(self, base_path, overlay_path, offset=(0, 0)):
+        """Returns the base image with the overlay blitted on top.
+
+        Parameters
+        ----------
+        base_path : str
+            Path to the base tile image.
+        overlay_path : str
+            Path to the overlay image.
+        offset : tuple of int
+            Position of the overlay relative to the top left of the base.
+
+        Returns
+        -------
+        pygame.Surface
+            The composited tile, a separate surface for every variant.
+        """
+        key = self.cache_key(base_path, overlay_path, offset)
+        if key in self._variants:
+            return self._variants[key]
+
+        cache_file = self.cache_path / f"{key}.png"
+        surface = self._load_cached(cache_file)
+        if surface is None:
+            self._log.debug(f"Baking tile variant {base_path!r} + {overlay_path!r}.")
+            surface = self.load_image(base_path)
+            surface.blit(self.load_image(overlay_path), offset)
+            self._store(cache_file, surface)
+
+        self._variants[key] = surface
+        return surface
+
+    def cache_key(self, base_path, overlay_path, offset):
+        """Creates the cache key for a tile variant."""
+        x, y = offset
+        key = "-".join(
+            [
+                self.hash_image(base_path),
+                self.hash_image(overlay_path),
+                str(int(x)),
+                str(int(y)),
+            ]
+        )
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def hash_image(self, image_path):
+        """Returns a hash of the contents of an image file.
+
+        The file is only read when its size or modification time differ
+        from the ones stored in the hash index.
+        """
+        image_path = str(image_path)
+        try:
+            stat = os.stat(image_path)
+        except FileNotFoundError as error:
+            raise FileNotFoundError(
+                f"Cannot find tile image {image_path!r}."
+            ) from error
+
+        size, mtime, digest = self._hashes.get(image_path, (None, None, None))
+        if (size, mtime) != (stat.st_size, stat.st_mtime_ns):
+            digest = self._hash_file(image_path)
+            self._hashes[image_path] = (stat.st_size, stat.st_mtime_ns, digest)
+            self._store_index()
+        return digest
+
+    @staticmethod
+    def _hash_file(image_path):
+        """Reads and hashes the contents of a file."""
+        with open(image_path, "rb") as image_file:
+            return hashlib.sha1(image_file.read()).hexdigest()
+
+    def _load_index(self):
+        """Loads the source hash index, returns an empty index when invalid."""
+        try:
+            with open(self._index_file, "r", encoding="utf-8") as json_file:
+                index = json.load(json_file)
+            return {
+                path: tuple(entry)
+                for path, entry in index.items()
+                if isinstance(entry, list) and len(entry) == 3
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, AttributeError):
+            self._log.warning(f"Ignoring invalid hash index {str(self._index_file)!r}.")
+            return {}
+
+    def _store_index(self):
+        """Writes the source hash index to the cache."""
+        try:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            with open(self._index_file, "w", encoding="utf-8") as json_file:
+                json.dump(self._hashes, json_file)
+        except OSError as error:
+            self._log.warning(f"Cannot store hash index: {error}")
+
+    def _load_cached(self, cache_file):
+        """Loads a baked variant from the cache, returns None on a miss."""
+        if not cache_file.exists():
+            return None
+
+        try:
+            self._log.debug(f"Loading cached tile variant {str(cache_file)!r}.")
+            return pygame.image.load(str(cache_file))
+        except pygame.error:
+            self._log.warning(f"Ignoring invalid cached tile {str(cache_file)!r}.")
+            return None
+
+    def _store(self, cache_file, surface):
+        """Writes a baked variant to the cache."""
+        # Write to a temporary file first, so readers never see partial files
+        temp_file = cache_file.with_name(f"{cache_file.stem}.tmp.png")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            pygame.image.save(surface, str(temp_file))
+            os.replace(temp_file, cache_file)
+        except (OSError, pygame.error) as error:
+            self._log.warning(f"Cannot cache tile {str(cache_file)!r}: {error}")
@@ -4,6 +4,8 @@ import logging
 import pygame
 
 from game.level import Level
+from game.memory import SurfaceBudget
+from game.pacing import FramePacer
 
 
 class EngineError(Exception):
@@ -49,6 +51,17 @@ class GameEngine:
         except ValueError:
             self.error(f"Invalid background color: {self.bg_color!r}.")
 
+        self.budget = None
+        budget_mb = settings.get("surface_budget_mb")
+        if budget_mb is not None:
+            try:
+                self.budget = SurfaceBudget(
+                    float(budget_mb) * 2**20,
+                    settings.get("surface_budget_action", "warn"),
+                )
+            except ValueError as error:
+                self.error(f"Invalid surface budget: {error}")
+
         # Create the game window
         self.log.debug(f"Creating window: {width} x {height}.")
         self.window_size = pygame.Vector2(width, height)
@@ -58,6 +71,11 @@ class GameEngine:
         self.clock = pygame.time.Clock()
         self.running = False
 
+        # Adapt optional work to the frame time
+        self.pacer = None
+        if settings.get("adaptive_pacing", True):
+            self.pacer = FramePacer(self.fps)
+
         # Load the first level
         if not settings.get("levels"):
             self.error("No levels supplied, nothing left to play.")
@@ -71,6 +89,8 @@ class GameEngine:
         if len(levels) > self._level_nr + 1:
             self._level_nr += 1
             self.level = Level(levels[self._level_nr], self)
+            if self.budget:
+                self.budget.check(self.level)
         else:
             self.end_game()
 
@@ -87,6 +107,9 @@ class GameEngine:
         while self.running:
 
             self.clock.tick(self.fps)
+            if self.pacer:
+                self.pacer.update(self.clock.get_rawtime())
+                self.apply_quality(self.pacer.state)
             self.draw()
 
             for event in pygame.event.get():
@@ -95,6 +118,14 @@ class GameEngine:
                     self.running = False
                     break
 
+        if self.pacer:
+            self.log.info(f"Frame stats: {self.pacer.stats()}")
+
+    def apply_quality(self, state):
+        """Applies the quality settings from the frame pacer."""
+        self.level.animation_interval = state["animation_interval"]
+        self.level.background.enabled = state["background"]
+
     def draw(self):
         """Redraws the screen."""
         if not self.level.ended:
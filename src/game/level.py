@@ -6,8 +6,11 @@ import pygame
 from .assets import AssetMixin
 
 from game.tiles import Tile, Tileset
+from game.compositor import TileCompositor, DEFAULT_CACHE_PATH
 from game.player import Player
 from game.camera import BoundedCamera
+from game.render import RenderQueue, BACKGROUND, TILES, ACTORS
+from game.background import ParallaxLayer, ParallaxBackground
 
 
 class LevelFileError(Exception):
@@ -34,7 +37,10 @@ class Level(AssetMixin):
         # Create the level
         self.offset = pygame.Vector2(0, 0)
         self.level = self.load(level_path, engine.settings)
-        self.tileset = Tileset(self.level["tileset"])
+        compositor = TileCompositor(
+            engine.settings.get("tile_cache", DEFAULT_CACHE_PATH)
+        )
+        self.tileset = Tileset(self.level["tileset"], compositor)
         self.tiles, self.bounds = self.construct(self.level["tiles"], self.tileset)
 
         # Create the camera
@@ -42,11 +48,22 @@ class Level(AssetMixin):
 
         # Add the player
         self.player = self._spawn_player()
+        self.actors = [self.player]
+
+        # Register everything that needs drawing
+        self.background = self._create_background()
+        self.render_queue = RenderQueue()
+        self.render_queue.add(self.background, BACKGROUND)
+        self.render_queue.add(self.tiles, TILES)
+        self.render_queue.add(self.actors, ACTORS)
 
         # Level status
         self.failed = False
         self.ended = False
 
+        # Milliseconds between animation frames
+        self.animation_interval = 100
+
     def load(self, level_path, defaults):
         """Loads a level from a JSON file."""
         self.log.debug(f"Loading level: {level_path!r}")
@@ -113,6 +130,27 @@ class Level(AssetMixin):
 
         return Player(spawn_x, spawn_y, self)
 
+    def _create_background(self):
+        """Creates the parallax background layers for the level."""
+        layers = []
+        for layer in self.level.get("parallax", []):
+            try:
+                layers.append(
+                    ParallaxLayer(
+                        layer["image"],
+                        layer.get("scroll", 0.5),
+                        self.engine.window_size,
+                        layer.get("y", 0),
+                        layer.get("height"),
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                self.error(
+                    f"Invalid parallax layer {layer!r}, "
+                    "use an object with at least an 'image' attribute."
+                )
+        return ParallaxBackground(layers)
+
     def draw(self, target):
         """Updates the player, camera, and level."""
 
@@ -124,9 +162,7 @@ class Level(AssetMixin):
         self.camera.update(self.player)
 
         # Draw everything
-        for tile in self.tiles:
-            target.blit(tile.image, self.camera.apply(tile))
-        target.blit(self.player.image, self.camera.apply(self.player))
+        self.render_queue.render(target, self.camera)
 
     def error(self, msg):
         """Logs and handles exceptions."""
@@ -0,0 +1,222 @@
+"""Memory accounting for levels and their surfaces.
+
+Reports the memory held by a level per subsystem and enforces an optional
+surface memory budget::
+
+    python -m game.memory assets/levels/W01_L01.json
+"""
+import os
+import sys
+import logging
+import argparse
+
+import pygame
+
+from game.actor import Actor
+from game.background import ParallaxLayer
+
+# Report sections holding pixel data, these count towards the budget
+SURFACE_SECTIONS = ("tileset_surfaces", "actor_frames", "background", "caches")
+
+
+def surface_bytes(surface):
+    """Returns the number of bytes used by the pixels of a surface."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def level_memory(level):
+    """Reports the memory held by a level, in bytes per subsystem.
+
+    Surfaces shared between several tiles, actors or layers are counted
+    once, in the first section that uses them. Only surfaces created while
+    loading are included, not short-lived ones such as flipped actor frames.
+
+    Parameters
+    ----------
+    level : game.level.Level
+        Level to report on.
+
+    Returns
+    -------
+    dict
+        Dict mapping subsystem names to bytes.
+    """
+    counted = set()
+
+    def count(surfaces):
+        total = 0
+        for surface in surfaces:
+            if id(surface) not in counted:
+                counted.add(id(surface))
+                total += surface_bytes(surface)
+        return total
+
+    tiles = level.tiles.sprites()
+    report = {
+        "tile_sprites": sum(
+            sys.getsizeof(tile) + sys.getsizeof(tile.__dict__) for tile in tiles
+        ),
+        "tile_rects": sum(sys.getsizeof(tile.rect) for tile in tiles),
+        "tileset_surfaces": count(level.tileset.surfaces()),
+        "actor_frames": count(
+            frame
+            for actor in level.actors
+            for frames in actor.frames.values()
+            for frame in frames
+        ),
+        "background": count(layer.strip for layer in level.background.layers),
+    }
+
+    # Shared caches may hold surfaces from earlier levels as well
+    report["caches"] = count(
+        [
+            frame
+            for frame_set in Actor.cached_frames()
+            for frames in frame_set.values()
+            for frame in frames
+        ]
+        + ParallaxLayer.cached_strips()
+    )
+
+    return report
+
+
+def evict_caches(level):
+    """Drops the shared surfaces the level does not use.
+
+    Surfaces in use by the level stay cached, so new actors and layers
+    keep sharing them. This only frees surfaces cached for earlier levels.
+
+    Parameters
+    ----------
+    level : game.level.Level
+        Level whose surfaces are kept.
+    """
+    Actor.clear_frame_cache(keep=[actor.frames for actor in level.actors])
+    ParallaxLayer.clear_cache(keep=[layer.strip for layer in level.background.layers])
+
+
+class SurfaceBudget:
+    """Checks the surface memory of a level against an upper limit.
+
+    The budget covers the surfaces created while loading a level, see
+    ``level_memory``, and is checked when a level is loaded. Evicting only
+    frees cached surfaces of earlier levels, it cannot lower the memory
+    used by the current level, so a level over budget is still loaded.
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of bytes of surface memory.
+    action : {"warn", "evict"}
+        Only log a warning, or evict the shared caches before warning.
+    """
+
+    actions = ("warn", "evict")
+
+    def __init__(self, limit, action="warn"):
+        self.log = logging.getLogger(self.__class__.__name__)
+
+        if action not in self.actions:
+            raise ValueError(
+                f"Invalid budget action {action!r}, use one of {self.actions!r}."
+            )
+        self.limit = int(limit)
+        self.action = action
+
+    @staticmethod
+    def used(report):
+        """Returns the surface memory in a memory report."""
+        return sum(report[section] for section in SURFACE_SECTIONS)
+
+    def exceeded(self, report):
+        """Checks if a memory report exceeds the budget."""
+        return self.used(report) > self.limit
+
+    def check(self, level):
+        """Checks the level against the budget.
+
+        Parameters
+        ----------
+        level : game.level.Level
+            Level to check.
+
+        Returns
+        -------
+        dict
+            The memory report after enforcing the budget.
+        """
+        report = level_memory(level)
+        if not self.exceeded(report):
+            return report
+
+        if self.action == "evict":
+            self.log.info("Surface budget exceeded, evicting caches.")
+            evict_caches(level)
+            report = level_memory(level)
+
+        if self.exceeded(report):
+            used = self.used(report)
+            self.log.warning(
+                f"Surface memory {used / 2**20:.1f} MB "
+                f"exceeds budget of {self.limit / 2**20:.1f} MB."
+            )
+        return report
+
+
+def format_report(report):
+    """Formats a memory report as a table in KiB."""
+    lines = [
+        f"  {section:<18}{size / 1024:>10.1f} KiB" for section, size in report.items()
+    ]
+    lines.append(f"  {'total':<18}{sum(report.values()) / 1024:>10.1f} KiB")
+    return "\n".join(lines)
+
+
+def main(args=None):
+    """Command line entry point for the memory report."""
+    parser = argparse.ArgumentParser(description="Report memory used per level.")
+    parser.add_argument("levels", nargs="*", help="Level JSON files to report on.")
+    parser.add_argument(
+        "--budget-mb", type=float, help="Surface budget to check levels against."
+    )
+    args = parser.parse_args(args)
+
+    # Imported here, the engine itself uses the budget from this module
+    from game.engine import GameEngine
+    from game.settings import SETTINGS
+
+    # Loading levels requires a display, use a hidden one
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+
+    settings = dict(SETTINGS, surface_budget_mb=None)
+    if args.levels:
+        settings["levels"] = args.levels
+    engine = GameEngine(settings)
+
+    budget = None
+    if args.budget_mb is not None:
+        budget = SurfaceBudget(args.budget_mb * 2**20)
+
+    exceeded = False
+    for level_nr, level_path in enumerate(settings["levels"]):
+        if level_nr:
+            engine.next_level()
+
+        if budget:
+            report = budget.check(engine.level)
+        else:
+            report = level_memory(engine.level)
+        print(f"{level_path}:")
+        print(format_report(report))
+
+        if budget and budget.exceeded(report):
+            print(f"  Exceeds surface budget of {args.budget_mb} MB.")
+            exceeded = True
+
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
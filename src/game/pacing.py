@@ -0,0 +1,132 @@
+"""Module for the FramePacer class."""
+import logging
+from collections import deque
+
+
+class FramePacer:
+    """Adapts optional work to the measured frame time.
+
+    Keeps a window of recent frame times. When the average exceeds the
+    frame budget, optional work is stepped down one quality level, most
+    expensive work first. When a step does not lower the frame time, the
+    pacer moves on to the next level. After a sustained period with
+    headroom, quality is stepped back up again.
+
+    Parameters
+    ----------
+    fps : int
+        Target frames per second.
+    window : int
+        Number of frames to average over.
+    overload : float
+        Step down when the average exceeds this fraction of the budget.
+    headroom : float
+        Step up when the average stays below this fraction of the budget.
+    recover : int
+        Number of frames with headroom required before stepping up.
+    improvement : float
+        A step down must bring the average below this fraction of the
+        average before the step, otherwise the next level is tried.
+    """
+
+    # Quality levels, from best to cheapest, ordered by the work they save
+    levels = (
+        {"background": True, "animation_interval": 100},
+        {"background": False, "animation_interval": 100},
+        {"background": False, "animation_interval": 200},
+    )
+
+    def __init__(
+        self,
+        fps,
+        window=30,
+        overload=0.9,
+        headroom=0.6,
+        recover=120,
+        improvement=0.95,
+    ):
+        self.log = logging.getLogger(self.__class__.__name__)
+
+        self.budget = 1000 / fps
+        self.overload = overload
+        self.headroom = headroom
+        self.recover = recover
+        self.improvement = improvement
+
+        self.quality = 0
+        self.frames = 0
+        self.samples = deque(maxlen=window)
+        self._calm = 0
+        self._before_step = None
+
+    @property
+    def state(self):
+        """Returns the settings for the current quality level."""
+        return dict(self.levels[self.quality], quality=self.quality)
+
+    def stats(self):
+        """Returns frame time statistics in milliseconds."""
+        samples = self.samples or [0]
+        return {
+            "frames": self.frames,
+            "budget": self.budget,
+            "average": sum(samples) / len(samples),
+            "max": max(samples),
+            "quality": self.quality,
+        }
+
+    def update(self, frame_time):
+        """Records a frame time and adjusts the quality level.
+
+        Parameters
+        ----------
+        frame_time : int
+            Time spent on the last frame in milliseconds, excluding waiting.
+
+        Returns
+        -------
+        bool
+            True when the quality level changed.
+        """
+        self.frames += 1
+        self.samples.append(frame_time)
+        if len(self.samples) < self.samples.maxlen:
+            return False
+
+        average = sum(self.samples) / len(self.samples)
+
+        cheapest = len(self.levels) - 1
+
+        # Move on to the next level when a step down did not help
+        if self._before_step is not None:
+            before, self._before_step = self._before_step, None
+            if average > before * self.improvement and self.quality < cheapest:
+                return self._step(1, average)
+
+        if average > self.budget * self.overload:
+            self._calm = 0
+            if self.quality < cheapest:
+                return self._step(1, average)
+
+        elif average < self.budget * self.headroom:
+            self._calm += 1
+            if self._calm >= self.recover and self.quality > 0:
+                return self._step(-1, average)
+
+        else:
+            self._calm = 0
+
+        return False
+
+    def _step(self, step, average):
+        """Moves the quality level and starts a fresh measurement window."""
+        self.quality += step
+        self.samples.clear()
+        self._calm = 0
+        self._before_step = average if step > 0 else None
+
+        self.log.info(
+            f"Average frame time {average:.1f} ms of {self.budget:.1f} ms, "
+            f"quality level set to {self.quality}: {self.levels[self.quality]}."
+        )
+        return True
@@ -0,0 +1,501 @@
+"""Offline reachability analysis for game levels.
+
+Builds a navigation graph over the tile grid of a level using closed-form
+jump arcs, so platforms can be checked without simulating playthroughs::
+
+    python -m game.reachability assets/levels/W01_L01.json
+"""
+import json
+import math
+import hashlib
+import logging
+import argparse
+from pathlib import Path
+
+from game.actor import Actor
+from game.assets import AssetMixin
+
+
+DEFAULT_CACHE_PATH = ".cache/reachability"
+
+# Part of the cache key, bump whenever the graph or the way it is built changes
+GRAPH_VERSION = 2
+
+
+class ReachabilityError(Exception):
+    """Raised when a level cannot be analyzed."""
+
+
+class JumpGraph:
+    """Navigation graph between the platforms of a level.
+
+    Nodes are ``(row, left, right)`` tuples: the actor stands on top of tile
+    row ``row`` with its left edge anywhere from ``left`` to ``right`` pixels.
+    The actor can walk freely within a node. Edges are labelled with the move
+    connecting two nodes: ``"jump"`` or ``"drop"``.
+
+    Parameters
+    ----------
+    nodes : list of tuple of int
+        Platforms as ``(row, left, right)`` tuples.
+    edges : list of tuple
+        Edges as ``(source, target, kind)`` tuples.
+    """
+
+    def __init__(self, nodes, edges):
+        self.nodes = list(nodes)
+        self.edges = {node: {} for node in self.nodes}
+        for source, target, kind in edges:
+            self.edges[source][target] = kind
+
+    def neighbours(self, node):
+        """Returns the nodes reachable from a node in a single move."""
+        return self.edges.get(node, {})
+
+    def reachable(self, *starts):
+        """Returns all nodes reachable from the start nodes."""
+        seen = set(starts)
+        todo = list(starts)
+        while todo:
+            node = todo.pop()
+            for target in self.neighbours(node):
+                if target not in seen:
+                    seen.add(target)
+                    todo.append(target)
+        return seen
+
+    def to_json(self):
+        """Converts the graph to a JSON serializable dict."""
+        return {
+            "nodes": [list(node) for node in self.nodes],
+            "edges": [
+                [list(source), list(target), kind]
+                for source, targets in self.edges.items()
+                for target, kind in targets.items()
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, content):
+        """Creates a graph from the output of ``to_json``."""
+        nodes = [tuple(node) for node in content["nodes"]]
+        edges = [
+            (tuple(source), tuple(target), kind)
+            for source, target, kind in content["edges"]
+        ]
+        return cls(nodes, edges)
+
+
+class ReachabilityAnalyzer(AssetMixin):
+    """Analyzes which platforms of a level the player can reach.
+
+    Horizontal positions are tracked as sets of pixel intervals, so a node
+    covers every position the actor can stand on, including positions that
+    only partly overlap a platform, like ``Actor.move_vertical`` allows.
+
+    Parameters
+    ----------
+    level_path : str
+        Path to the level JSON file.
+    speed : float
+        Horizontal speed in pixels per frame.
+    jump_speed : float
+        Initial upwards speed of a jump in pixels per frame.
+    gravity : float
+        Downwards acceleration in pixels per frame squared.
+    actor_size : tuple of int
+        Width and height of the actor in pixels.
+    cache_path : str or pathlib.Path, optional
+        Folder to cache graphs in, disables caching when None.
+    """
+
+    # Give up on arcs that have not landed after this many frames
+    max_frames = 1000
+
+    def __init__(
+        self,
+        level_path,
+        speed=Actor.speed,
+        jump_speed=Actor.jump_speed,
+        gravity=Actor.gravity,
+        actor_size=(64, 64),
+        cache_path=DEFAULT_CACHE_PATH,
+    ):
+        self._log = logging.getLogger(__name__)
+
+        self.speed = speed
+        self.jump_speed = jump_speed
+        self.gravity = gravity
+        self.actor_width, self.actor_height = actor_size
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        self.level = self.load_json(level_path)
+        for attribute in "tiles", "tileset", "spawn":
+            if attribute not in self.level:
+                self._error(f"Level {level_path!r} misses attribute {attribute!r}.")
+
+        self.tiles = self.level["tiles"]
+        self.width = len(self.tiles[0]) if self.tiles else 0
+        self.height = len(self.tiles)
+
+        tileset = self.load_json(self.level["tileset"])
+        self.tile_width = int(tileset["tile_width"])
+        self.tile_height = int(tileset["tile_height"])
+
+        # Positions of the actor's left edge that overlap solid tiles, per row
+        self.world = [(0, self.width * self.tile_width - self.actor_width)]
+        self._blocked = [self.blocked_row(y) for y in range(self.height)]
+
+    def analyze(self, rebuild=False):
+        """Builds the graph and reports the unreachable platforms.
+
+        Parameters
+        ----------
+        rebuild : bool
+            Ignore any cached graph and rebuild it.
+
+        Returns
+        -------
+        dict
+            Report with the start nodes, node counts and unreachable
+            platforms as ``(row, first column, last column)`` tuples.
+        """
+        graph = self.graph(rebuild)
+        nodes = self.nodes()
+        starts = list(self.arc(*self.spawn_position(), 0, nodes))
+        reached = graph.reachable(*starts)
+
+        return {
+            "start": starts,
+            "nodes": len(graph.nodes),
+            "reachable": len(reached),
+            "unreachable": [
+                self.columns(node) for node in graph.nodes if node not in reached
+            ],
+        }
+
+    def graph(self, rebuild=False):
+        """Returns the jump graph, loaded from the cache when possible."""
+        cache_file = None
+        if self.cache_path:
+            cache_file = self.cache_path / f"{self.level_hash()}.json"
+            if cache_file.exists() and not rebuild:
+                graph = self._load_cached(cache_file)
+                if graph:
+                    return graph
+
+        graph = self.build_graph()
+
+        if cache_file:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, "w", encoding="utf-8") as json_file:
+                    json.dump(graph.to_json(), json_file)
+            except OSError as error:
+                self._log.warning(f"Cannot cache graph {str(cache_file)!r}: {error}")
+
+        return graph
+
+    def _load_cached(self, cache_file):
+        """Loads a cached graph, returns None when the file is unreadable."""
+        try:
+            self._log.debug(f"Loading cached graph {str(cache_file)!r}.")
+            return JumpGraph.from_json(self.load_json(cache_file))
+        except (OSError, RuntimeError, KeyError, TypeError, ValueError):
+            self._log.warning(f"Ignoring invalid cached graph {str(cache_file)!r}.")
+            return None
+
+    def level_hash(self):
+        """Hashes everything the graph depends on."""
+        content = json.dumps(
+            [
+                GRAPH_VERSION,
+                self.tiles,
+                self.tile_width,
+                self.tile_height,
+                self.speed,
+                self.jump_speed,
+                self.gravity,
+                self.actor_width,
+                self.actor_height,
+            ]
+        )
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def build_graph(self):
+        """Builds the jump graph from closed-form movement arcs."""
+        nodes = self.nodes()
+        speed = int(self.speed)
+
+        edges = []
+        for source in nodes:
+            row, left, right = source
+            top = row * self.tile_height - self.actor_height
+
+            # Dropping means walking off the ledge first, then falling
+            ledges = _expand([(left, right)], speed, self.world)
+            ledges = _subtract(ledges, [(left, right)])
+            ledges = _subtract(ledges, self.blocked(top))
+            moves = [
+                ("drop", self.arc(ledges, top, 0, nodes)),
+                ("jump", self.arc([(left, right)], top, -self.jump_speed, nodes)),
+            ]
+
+            targets = {}
+            for kind, landed in moves:
+                for target in landed:
+                    if target != source and target not in targets:
+                        targets[target] = kind
+            edges.extend((source, target, kind) for target, kind in targets.items())
+
+        self._log.debug(f"Built graph with {len(nodes)} nodes, {len(edges)} edges.")
+        return JumpGraph(nodes, edges)
+
+    def nodes(self):
+        """Returns all platforms the actor can stand on."""
+        nodes = []
+        for row in range(self.height):
+            supported = _intersect(self._blocked[row], self.world)
+            top = row * self.tile_height - self.actor_height
+            standing = _subtract(supported, self.blocked(top))
+            nodes.extend((row, left, right) for left, right in standing)
+        return nodes
+
+    def arc(self, positions, top, initial_speed, nodes):
+        """Finds the nodes an arc can land on while steering mid-air.
+
+        The vertical offset after ``t`` frames follows from the per-frame
+        update in ``Actor.move_vertical``:
+        ``y(t) = v0 * t + gravity * t * (t + 1) / 2``. Every frame, the set
+        of horizontal positions grows by the actor speed in both directions
+        and positions colliding with tiles are dropped. This covers every
+        path the player can steer, such as rising past a block before
+        moving over it. Bumping into a ceiling stops the ascent and
+        continues as a fall from just below the ceiling.
+
+        Parameters
+        ----------
+        positions : list of tuple of int
+            Intervals of the actor's left edge at takeoff.
+        top : float
+            Top of the actor at takeoff in pixels.
+        initial_speed : float
+            Initial vertical speed, negative is upwards.
+        nodes : list of tuple of int
+            Nodes to land on.
+
+        Returns
+        -------
+        set of tuple of int
+            Nodes the arc can land on.
+        """
+        speed = int(self.speed)
+        level_height = self.height * self.tile_height
+
+        landed = set()
+        for frame in range(1, self.max_frames):
+            if not positions or top >= level_height:
+                break
+
+            step = initial_speed + self.gravity * frame
+            previous, top = top, top + step
+            blocked = self.blocked(top)
+
+            # Bumping into a ceiling stops the ascent
+            if step < 0:
+                bumped = _intersect(positions, blocked)
+                if bumped:
+                    landed.update(self.bumped_into(bumped, previous, top, nodes))
+
+            # Falling onto a tile lands the actor on top of it
+            if step > 0:
+                landing = _intersect(positions, blocked)
+                if landing:
+                    landed.update(self.landed_on(landing, previous, top, nodes))
+
+            positions = _subtract(positions, blocked)
+            positions = _subtract(_expand(positions, speed, self.world), blocked)
+
+        return landed
+
+    def bumped_into(self, positions, previous, top, nodes):
+        """Returns the nodes reached after bumping into a ceiling."""
+        speed = int(self.speed)
+        first_row = math.floor(top / self.tile_height)
+        last_row = math.floor(previous / self.tile_height) - 1
+
+        landed = set()
+        for row in range(min(self.height - 1, last_row), max(-1, first_row - 1), -1):
+            hit = _intersect(positions, self._blocked[row])
+            if not hit:
+                continue
+
+            # The actor is moved right below the tile and starts falling
+            ceiling = (row + 1) * self.tile_height
+            blocked = self.blocked(ceiling)
+            hit = _subtract(_expand(hit, speed, self.world), blocked)
+            landed.update(self.arc(hit, ceiling, 0, nodes))
+            positions = _subtract(positions, self._blocked[row])
+        return landed
+
+    def landed_on(self, positions, previous, top, nodes):
+        """Returns the nodes hit by falling from ``previous`` to ``top``."""
+        first_row = math.ceil((previous + self.actor_height) / self.tile_height)
+        last_row = math.ceil((top + self.actor_height) / self.tile_height) - 1
+
+        hits = set()
+        for row in range(max(0, first_row), min(self.height, last_row + 1)):
+            landing = _intersect(positions, self._blocked[row])
+            if not landing:
+                continue
+            for node in nodes:
+                if node[0] == row and _intersect(landing, [node[1:]]):
+                    hits.add(node)
+            positions = _subtract(positions, landing)
+        return hits
+
+    def blocked(self, top):
+        """Returns the left edge positions colliding with tiles at a height."""
+        first_row = math.floor(top / self.tile_height)
+        last_row = math.ceil((top + self.actor_height) / self.tile_height) - 1
+
+        blocked = []
+        for row in range(max(0, first_row), min(self.height, last_row + 1)):
+            blocked.extend(self._blocked[row])
+        return _merge(blocked)
+
+    def blocked_row(self, row):
+        """Returns the left edge positions colliding with a row of tiles."""
+        width = self.tile_width
+        return _merge(
+            [
+                (x * width - self.actor_width + 1, (x + 1) * width - 1)
+                for x in range(self.width)
+                if self.solid(x, row)
+            ]
+        )
+
+    def solid(self, x, y):
+        """Checks if the tile at the coordinates is solid."""
+        if not 0 <= y < self.height or not 0 <= x < self.width:
+            return False
+        return self.tiles[y][x] != " "
+
+    def spawn_position(self):
+        """Returns the spawn position as left edge intervals and top."""
+        try:
+            spawn_x, spawn_y = [int(v) for v in self.level["spawn"]]
+        except (TypeError, ValueError):
+            self._error("Invalid player spawn point, use [x, y] integers.")
+
+        if self.solid(spawn_x, spawn_y):
+            self._error(f"Player spawns inside a tile at {(spawn_x, spawn_y)!r}.")
+
+        left = spawn_x * self.tile_width
+        return [(left, left)], spawn_y * self.tile_height
+
+    def find_node(self, x, y):
+        """Returns the node of an actor standing in tile cell ``(x, y)``."""
+        left = x * self.tile_width
+        for node in self.nodes():
+            if node[0] == y + 1 and node[1] <= left <= node[2]:
+                return node
+        return None
+
+    def columns(self, node):
+        """Converts a node to its row and the columns it stands on."""
+        row, left, right = node
+        return (
+            row,
+            (left + self.actor_width - 1) // self.tile_width,
+            right // self.tile_width,
+        )
+
+    def _error(self, msg):
+        """Logs and handles exceptions."""
+        self._log.error(msg)
+        raise ReachabilityError(msg)
+
+
+def _merge(intervals):
+    """Merges overlapping or adjacent closed integer intervals."""
+    merged = []
+    for low, high in sorted(intervals):
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+        else:
+            merged.append((low, high))
+    return merged
+
+
+def _intersect(first, second):
+    """Intersects two sorted lists of closed integer intervals."""
+    result = []
+    for low, high in first:
+        for other_low, other_high in second:
+            if max(low, other_low) <= min(high, other_high):
+                result.append((max(low, other_low), min(high, other_high)))
+    return _merge(result)
+
+
+def _subtract(first, second):
+    """Removes the second list of intervals from the first."""
+    result = []
+    for low, high in first:
+        for other_low, other_high in second:
+            if other_high < low or other_low > high:
+                continue
+            if other_low > low:
+                result.append((low, other_low - 1))
+            low = max(low, other_high + 1)
+            if low > high:
+                break
+        else:
+            result.append((low, high))
+    return _merge(result)
+
+
+def _expand(intervals, distance, bounds):
+    """Grows intervals by a distance in both directions, within bounds."""
+    grown = [(low - distance, high + distance) for low, high in intervals]
+    return _intersect(_merge(grown), bounds)
+
+
+def main(args=None):
+    """Command line entry point for the reachability analyzer."""
+    parser = argparse.ArgumentParser(
+        description="Report level platforms the player cannot reach."
+    )
+    parser.add_argument("levels", nargs="+", help="Level JSON files to analyze.")
+    parser.add_argument("--speed", type=float, default=Actor.speed)
+    parser.add_argument("--jump-speed", type=float, default=Actor.jump_speed)
+    parser.add_argument("--gravity", type=float, default=Actor.gravity)
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH)
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Ignore cached graphs."
+    )
+    args = parser.parse_args(args)
+
+    unreachable = 0
+    for level_path in args.levels:
+        analyzer = ReachabilityAnalyzer(
+            level_path,
+            speed=args.speed,
+            jump_speed=args.jump_speed,
+            gravity=args.gravity,
+            cache_path=args.cache_path,
+        )
+        report = analyzer.analyze(args.rebuild)
+
+        print(f"{level_path}: {report['reachable']}/{report['nodes']} reachable.")
+        if not report["start"]:
+            print("  Player falls out of the level after spawning.")
+        for row, x_start, x_end in report["unreachable"]:
+            print(f"  Unreachable: on top of row {row}, columns {x_start}-{x_end}.")
+        unreachable += len(report["unreachable"])
+
+    return 1 if unreachable else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
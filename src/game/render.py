@@ -0,0 +1,99 @@
+"""Module for the RenderQueue class."""
+
+# Render layers, drawn from low to high
+BACKGROUND = 0
+TILES = 10
+ACTORS = 20
+FOREGROUND = 30
+UI = 40
+
+
+class RenderQueue:
+    """Collects draw commands per layer and submits them in batches.
+
+    Sources are registered once with ``add`` and are asked for their draw
+    commands every frame. A source can be:
+
+    - an object with a ``commands(camera)`` method returning an iterable
+      of ``(surface, position)`` tuples;
+    - a single sprite-like object with ``image`` and ``rect`` attributes;
+    - an iterable of sprite-like objects, such as a ``pygame.sprite.Group``.
+
+    One-off commands can be added for the current frame with ``submit``.
+    """
+
+    def __init__(self):
+        self._sources = {}
+        self._commands = {}
+
+    def add(self, source, layer):
+        """Registers a source of draw commands on a layer.
+
+        Parameters
+        ----------
+        source : Any
+            Source of draw commands, see the class docstring.
+        layer : int
+            Layer to draw the source on, higher layers are drawn on top.
+        """
+        self._sources.setdefault(layer, []).append(source)
+
+    def remove(self, source):
+        """Removes a previously registered source."""
+        for sources in self._sources.values():
+            if source in sources:
+                sources.remove(source)
+
+    def submit(self, image, position, layer):
+        """Adds a single draw command for the current frame only.
+
+        Parameters
+        ----------
+        image : pygame.Surface
+            Surface to draw.
+        position : pygame.Rect or tuple of int
+            Screen position to draw the surface at.
+        layer : int
+            Layer to draw the surface on.
+        """
+        self._commands.setdefault(layer, []).append((image, position))
+
+    def render(self, target, camera):
+        """Draws all sources and submitted commands onto the target.
+
+        Parameters
+        ----------
+        target : pygame.Surface
+            Surface to draw on.
+        camera : game.camera.BasicCamera
+            Camera used to translate world to screen positions.
+        """
+        layers = set(self._sources) | set(self._commands)
+        for layer in sorted(layers):
+            commands = []
+            for source in self._sources.get(layer, []):
+                commands.extend(self.collect(source, camera))
+            commands.extend(self._commands.get(layer, []))
+
+            if commands:
+                target.blits(commands, doreturn=False)
+
+        self._commands = {}
+
+    @staticmethod
+    def collect(source, camera):
+        """Gets the draw commands for a single source."""
+        if hasattr(source, "commands"):
+            return source.commands(camera)
+
+        offset = camera.state.topleft
+        if hasattr(source, "rect"):
+            sprites = [source]
+        else:
+            sprites = source
+
+        return [
+            (sprite.image, sprite.rect.move(offset))
+            for sprite in sprites
+            if getattr(sprite, "image", None) is not None
+        ]
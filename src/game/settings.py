@@ -7,8 +7,12 @@ SETTINGS = {
     "background": "#5A9AE1",
     "viewport": 0.2,
     "fps": 60,
+    "adaptive_pacing": True,
     "gravity": 0.18,
     "move_speed": 8,
     "jump_speed": 16,
+    "tile_cache": ".cache/tiles",
+    "surface_budget_mb": None,
+    "surface_budget_action": "warn",
     "levels": ["assets/levels/W01_L01.json"],
 }
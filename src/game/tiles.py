@@ -6,6 +6,7 @@ import logging
 import pygame
 
 from game.assets import AssetMixin
+from game.compositor import TileCompositor
 
 
 class TilesetFileError(Exception):
@@ -13,13 +14,22 @@ class TilesetFileError(Exception):
 
 
 class Tileset(AssetMixin):
-    """Tileset class that maps tile codes to sprites."""
+    """Tileset class that maps tile codes to sprites.
+
+    Parameters
+    ----------
+    tile_path : str
+        Path to the tileset JSON file.
+    compositor : game.compositor.TileCompositor, optional
+        Compositor used to build tiles with an overlay.
+    """
 
     _required = set(("tile_width", "tile_height", "tiles"))
     _valid_codes = set(string.ascii_letters + string.digits)
 
-    def __init__(self, tile_path):
+    def __init__(self, tile_path, compositor=None):
         self._log = logging.getLogger(__name__)
+        self._compositor = compositor or TileCompositor()
 
         tileset = self.load_json(tile_path)
         self.tile_width, self.tile_height = self.get_dimensions(tileset)
@@ -31,6 +41,10 @@ class Tileset(AssetMixin):
             self._error(f"Tile {tile_code!r} not found.")
         return self._map[tile_code]
 
+    def surfaces(self):
+        """Returns the surfaces of all tiles in the tileset."""
+        return [properties["image"] for properties in self._map.values()]
+
     def get_dimensions(self, tileset):
         """Gets tile dimensions from the tileset."""
 
@@ -64,23 +78,32 @@ class Tileset(AssetMixin):
         for code, properties in tileset["tiles"].items():
 
             self._log.debug(f"Processing tile {code}: {properties}.")
+            overlay = properties.get("overlay", None)
+
+            # Composite tile image and overlay
+            if "image" in properties and overlay:
+                surface = self._compositor.composite(
+                    properties["image"],
+                    overlay["image"],
+                    overlay.get("offset", (0, 0)),
+                )
             # Load tile image
-            if "image" in properties:
+            elif "image" in properties:
                 surface = self.load_image(properties["image"])
             # Create grey filler tile
             else:
                 surface = pygame.Surface((self.tile_width, self.tile_height))
                 surface.fill("grey")
-
-            # Add an overlay image
-            overlay = properties.get("overlay", None)
-            if overlay:
-                offset = overlay.get("offset", (0, 0))
-                overlay = self.load_image(overlay["image"])
-                surface.blit(overlay, offset)
-
-            properties["image"] = surface
-            tilemap[code] = properties
+                if overlay:
+                    surface.blit(
+                        self.load_image(overlay["image"]),
+                        overlay.get("offset", (0, 0)),
+                    )
+
+            # Keep the tileset specification itself untouched
+            tile = dict(properties)
+            tile["image"] = surface
+            tilemap[code] = tile
 
         return tilemap
 
@@ -0,0 +1,57 @@
+"""Tests for the parallax background layers."""
+import os
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from game.background import ParallaxLayer
+
+WINDOW = pygame.Vector2(100, 50)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    """Converting surfaces requires a display, use a hidden one."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((int(WINDOW.x), int(WINDOW.y)))
+    yield
+    pygame.display.quit()
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    image = pygame.Surface((30, 50))
+    image.fill("skyblue")
+    path = tmp_path / "sky.png"
+    pygame.image.save(image, str(path))
+    return str(path)
+
+
+def camera(x, y):
+    return SimpleNamespace(state=pygame.Rect(x, y, 1000, 1000))
+
+
+def test_strip_covers_window(image_path):
+    layer = ParallaxLayer(image_path, 0.5, WINDOW)
+    assert layer.strip.get_size() == (120, 50)
+    assert not layer.strip.get_flags() & pygame.SRCALPHA
+
+
+def test_at_most_two_blits(image_path):
+    layer = ParallaxLayer(image_path, 0.5, WINDOW)
+
+    assert len(layer.commands(camera(0, 0))) == 1
+    commands = layer.commands(camera(-100, 0))
+    assert len(commands) == 2
+
+    # The blits together cover the window width exactly
+    assert sum(area.width for _, _, area in commands) == WINDOW.x
+
+
+def test_scrolls_vertically(image_path):
+    layer = ParallaxLayer(image_path, 0.5, WINDOW, y=10)
+
+    (_, position, _), *_ = layer.commands(camera(0, -40))
+    assert position == (0, -10)
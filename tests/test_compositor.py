@@ -0,0 +1,58 @@
+"""Tests for the tile variant compositor."""
+import pygame
+import pytest
+
+from game.compositor import TileCompositor
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Creates a base and an overlay image."""
+    base = pygame.Surface((4, 4))
+    base.fill("red")
+    base_path = tmp_path / "base.png"
+    pygame.image.save(base, str(base_path))
+
+    overlay = pygame.Surface((2, 2))
+    overlay.fill("blue")
+    overlay_path = tmp_path / "overlay.png"
+    pygame.image.save(overlay, str(overlay_path))
+
+    return str(base_path), str(overlay_path)
+
+
+def pixels(surface):
+    return [surface.get_at((x, y)) for x in range(4) for y in range(4)]
+
+
+def test_composite(sources, tmp_path):
+    surface = TileCompositor(tmp_path / "cache").composite(*sources, (1, 1))
+
+    assert surface.get_at((0, 0)) == pygame.Color("red")
+    assert surface.get_at((1, 1)) == pygame.Color("blue")
+    assert surface.get_at((3, 3)) == pygame.Color("red")
+
+
+def test_cache_hit_skips_sources(sources, tmp_path, monkeypatch):
+    baked = TileCompositor(tmp_path / "cache").composite(*sources, (1, 1))
+
+    def fail(*args):
+        raise AssertionError("Source image was read on a cache hit.")
+
+    monkeypatch.setattr(TileCompositor, "load_image", fail)
+    monkeypatch.setattr(TileCompositor, "_hash_file", staticmethod(fail))
+
+    cached = TileCompositor(tmp_path / "cache").composite(*sources, (1, 1))
+    assert pixels(cached) == pixels(baked)
+
+
+def test_changed_source_invalidates_cache(sources, tmp_path):
+    baked = TileCompositor(tmp_path / "cache").composite(*sources, (1, 1))
+
+    overlay = pygame.Surface((3, 3))
+    overlay.fill("green")
+    pygame.image.save(overlay, sources[1])
+
+    changed = TileCompositor(tmp_path / "cache").composite(*sources, (1, 1))
+    assert changed.get_at((3, 3)) == pygame.Color("green")
+    assert pixels(changed) != pixels(baked)
@@ -0,0 +1,76 @@
+"""Tests for memory accounting and the surface budget."""
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from game.actor import Actor
+from game.player import Player
+from game.memory import SurfaceBudget, evict_caches, level_memory
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(autouse=True)
+def display(monkeypatch):
+    """Loading actors requires a display and the repository root."""
+    monkeypatch.chdir(ROOT)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    Actor.clear_frame_cache()
+    yield
+    Actor.clear_frame_cache()
+    pygame.display.quit()
+
+
+@pytest.fixture
+def level():
+    """Minimal level holding a single player."""
+    level = SimpleNamespace(
+        tiles=pygame.sprite.Group(),
+        tileset=SimpleNamespace(surfaces=lambda: []),
+        background=SimpleNamespace(layers=[]),
+        actors=[],
+    )
+    level.actors.append(Player(0, 0, level))
+    return level
+
+
+def stale_frames():
+    return {"idle": [pygame.Surface((8, 8))]}
+
+
+def test_identical_actors_share_frames(level):
+    other = Player(64, 0, level)
+    assert other.frames is level.actors[0].frames
+
+
+def test_evict_keeps_frames_in_use(level):
+    Actor._frame_sets[("stale", 8, 8)] = stale_frames()
+
+    evict_caches(level)
+
+    assert Actor.cached_frames() == [level.actors[0].frames]
+    assert Player(64, 0, level).frames is level.actors[0].frames
+
+
+def test_budget_evicts_unused_caches(level):
+    Actor._frame_sets[("stale", 8, 8)] = stale_frames()
+    assert level_memory(level)["caches"] == 8 * 8 * 4
+
+    report = SurfaceBudget(1, "evict").check(level)
+
+    assert report["caches"] == 0
+    assert report["actor_frames"] > 0
+    assert Player(64, 0, level).frames is level.actors[0].frames
+
+
+def test_budget_exceeded(level):
+    report = level_memory(level)
+    used = SurfaceBudget.used(report)
+
+    assert SurfaceBudget(used - 1).exceeded(report)
+    assert not SurfaceBudget(used).exceeded(report)
@@ -0,0 +1,49 @@
+"""Tests for the adaptive frame pacer."""
+from game.pacing import FramePacer
+
+
+def run(pacer, cost, frames):
+    """Feeds the pacer frame times computed from its current state."""
+    for _ in range(frames):
+        pacer.update(cost(pacer.state))
+
+
+def test_steady_under_budget():
+    pacer = FramePacer(60)
+    run(pacer, lambda state: 5, 2000)
+    assert pacer.quality == 0
+
+
+def test_background_dropped_under_overload():
+    pacer = FramePacer(60)
+    run(pacer, lambda state: 20 if state["background"] else 12, 2000)
+
+    assert pacer.quality == 1
+    assert pacer.state["background"] is False
+    assert pacer.stats()["average"] == 12
+
+
+def test_step_without_improvement_moves_on():
+    pacer = FramePacer(60)
+    costs = {0: 20, 1: 20, 2: 12}
+    run(pacer, lambda state: costs[state["quality"]], 2000)
+
+    assert pacer.quality == 2
+
+
+def test_recovers_with_headroom():
+    pacer = FramePacer(60)
+    run(pacer, lambda state: 20, 200)
+    assert pacer.quality == len(pacer.levels) - 1
+
+    run(pacer, lambda state: 2, 2000)
+    assert pacer.quality == 0
+
+
+def test_recovered_level_can_step_down_again():
+    pacer = FramePacer(60)
+    run(pacer, lambda state: 20, 200)
+    run(pacer, lambda state: 2, 2000)
+
+    run(pacer, lambda state: 20 if state["background"] else 12, 2000)
+    assert pacer.quality == 1
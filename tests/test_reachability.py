@@ -0,0 +1,69 @@
+"""Tests for the level reachability analyzer."""
+import json
+from pathlib import Path
+
+import pytest
+
+from game.reachability import ReachabilityAnalyzer
+
+ROOT = Path(__file__).parent.parent
+LEVEL = "assets/levels/W01_L01.json"
+
+
+@pytest.fixture(autouse=True)
+def in_root(monkeypatch):
+    """Level files use paths relative to the repository root."""
+    monkeypatch.chdir(ROOT)
+
+
+@pytest.fixture
+def analyzer():
+    return ReachabilityAnalyzer(LEVEL, cache_path=None)
+
+
+@pytest.fixture
+def graph(analyzer):
+    return analyzer.build_graph()
+
+
+def test_step_up_onto_block(analyzer, graph):
+    """Rising first and moving over the block afterwards reaches it."""
+    target = analyzer.find_node(20, 11)
+    assert target in graph.neighbours(analyzer.find_node(19, 12))
+
+    # The ceiling above the block leaves no room to enter it from the right
+    source = analyzer.find_node(21, 12)
+    assert target not in graph.neighbours(source)
+    assert target in graph.reachable(source)
+
+
+def test_jump_with_partial_overlap(analyzer, graph):
+    """Takeoff and landing only need to partly overlap the platforms."""
+    target = analyzer.find_node(27, 6)
+    assert target in graph.neighbours(analyzer.find_node(22, 6))
+
+
+def test_level_fully_reachable(analyzer):
+    assert analyzer.analyze()["unreachable"] == []
+
+
+def test_too_high_platform_unreachable(tmp_path):
+    level = {
+        "tileset": "assets/tilesets/W01.json",
+        "spawn": [1, 7],
+        "tiles": [" " * 10] * 4 + ["    AA    "] + [" " * 10] * 3 + ["A" * 10],
+    }
+    level_path = tmp_path / "level.json"
+    level_path.write_text(json.dumps(level), encoding="utf-8")
+
+    report = ReachabilityAnalyzer(level_path, cache_path=None).analyze()
+    assert report["unreachable"] == [(4, 4, 5)]
+
+
+def test_invalid_cache_is_rebuilt(tmp_path):
+    analyzer = ReachabilityAnalyzer(LEVEL, cache_path=tmp_path)
+    cache_file = tmp_path / f"{analyzer.level_hash()}.json"
+    cache_file.write_text("{not json", encoding="utf-8")
+
+    assert analyzer.analyze()["unreachable"] == []
+    assert json.loads(cache_file.read_text(encoding="utf-8"))["nodes"]
@@ -0,0 +1,97 @@
+"""Tests for the layered render queue."""
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from game.render import RenderQueue, BACKGROUND, TILES, ACTORS, UI
+
+
+class Target:
+    """Records the commands passed to each ``blits`` call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def blits(self, commands, doreturn=True):
+        self.calls.append(list(commands))
+
+
+def sprite(name, x=0, y=0):
+    return SimpleNamespace(image=name, rect=pygame.Rect(x, y, 8, 8))
+
+
+@pytest.fixture
+def camera():
+    return SimpleNamespace(state=pygame.Rect(-10, -20, 100, 100))
+
+
+def test_layers_drawn_in_order(camera):
+    queue = RenderQueue()
+    queue.add(sprite("player"), ACTORS)
+    queue.add([sprite("tile")], TILES)
+    queue.add(SimpleNamespace(commands=lambda camera: [("sky", (0, 0))]), BACKGROUND)
+
+    target = Target()
+    queue.render(target, camera)
+
+    images = [[image for image, *_ in call] for call in target.calls]
+    assert images == [["sky"], ["tile"], ["player"]]
+
+
+def test_one_blits_call_per_layer(camera):
+    queue = RenderQueue()
+    queue.add([sprite("a", 0), sprite("b", 8)], TILES)
+    queue.add([sprite("c", 16)], TILES)
+    queue.submit("d", (1, 2), TILES)
+
+    target = Target()
+    queue.render(target, camera)
+
+    assert len(target.calls) == 1
+    assert [image for image, *_ in target.calls[0]] == ["a", "b", "c", "d"]
+
+
+def test_sprites_moved_by_camera(camera):
+    queue = RenderQueue()
+    queue.add(sprite("player", 30, 40), ACTORS)
+
+    target = Target()
+    queue.render(target, camera)
+
+    assert target.calls == [[("player", pygame.Rect(20, 20, 8, 8))]]
+
+
+def test_sprites_without_image_skipped(camera):
+    queue = RenderQueue()
+    queue.add(SimpleNamespace(rect=pygame.Rect(0, 0, 8, 8)), ACTORS)
+
+    target = Target()
+    queue.render(target, camera)
+
+    assert target.calls == []
+
+
+def test_submitted_commands_cleared(camera):
+    queue = RenderQueue()
+    queue.add(sprite("tile"), TILES)
+    queue.submit("score", (0, 0), UI)
+
+    first, second = Target(), Target()
+    queue.render(first, camera)
+    queue.render(second, camera)
+
+    assert [call[0][0] for call in first.calls] == ["tile", "score"]
+    assert [call[0][0] for call in second.calls] == ["tile"]
+
+
+def test_removed_source_not_drawn(camera):
+    queue = RenderQueue()
+    player = sprite("player")
+    queue.add(player, ACTORS)
+    queue.remove(player)
+
+    target = Target()
+    queue.render(target, camera)
+
+    assert target.calls == []